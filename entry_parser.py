@@ -13,25 +13,68 @@ Each row can contain multiple participants (up to 5) with their class/affiliatio
 information in the team columns.
 """
 
+import codecs
 import csv
 import re
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import unicodedata
 
+# Try to import chardet for statistical encoding detection
+try:
+    import chardet
+    HAS_CHARDET = True
+except ImportError:
+    HAS_CHARDET = False
 
+# Precompiled patterns used in the per-row hot path
+# Extracts non-separator runs with trailing digits/spaces stripped in one scan
+_AFFIL_PART_RE = re.compile(r'([^/,、\s][^/,、]*?)\d*\s*(?=[/,、]|$)')
+_PARTICIPANT_RE = re.compile(r'(\d+)人目')
+
+
+@dataclass(slots=True)
+class Entry:
+    """
+    One participant parsed from the entry list.
+
+    Slots keep the per-entry footprint small (a dict with the same fields
+    costs several times more) and make field access a fixed-offset load
+    instead of a hash lookup in the processing hot paths.
+    """
+    class_name: str = ''
+    name1: str = ''
+    name2: str = ''
+    affiliation: str = ''
+    affiliations: Tuple[str, ...] = ()
+    card_number: str = ''
+    joa_number: str = ''
+    is_rental: bool = False
+    gender: str = ''
+    row_number: int = 0
+    participant_number: int = 0
+    original_class: str = ''
+
+
+@lru_cache(maxsize=8192)
 def normalize_whitespace(text: str) -> str:
     """
     Normalize whitespace in text.
     Converts full-width spaces to half-width and normalizes multiple spaces.
+
+    Cached: the same cell values (class names, affiliations, column headers)
+    recur across thousands of rows, so repeat calls become dict lookups.
     """
     if not text:
         return ""
 
-    # Convert full-width space to half-width
-    text = text.replace('\u3000', ' ')
-
-    # Normalize Unicode (NFKC converts full-width to half-width where applicable)
-    text = unicodedata.normalize('NFKC', text)
+    # Normalize Unicode (NFKC converts full-width to half-width where
+    # applicable, including U+3000 ideographic space -> ASCII space).
+    # ASCII text and already-normalized text can skip the transform entirely.
+    if not text.isascii() and not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
 
     # Remove leading/trailing whitespace and normalize internal spaces
     text = ' '.join(text.split())
@@ -39,62 +82,80 @@ def normalize_whitespace(text: str) -> str:
     return text
 
 
-def parse_affiliation(affiliation: str) -> List[str]:
+def parse_affiliation(affiliation: str) -> Tuple[str, ...]:
     """
     Parse affiliation string and extract individual affiliations.
     Affiliations may be separated by / or , and may contain numeric info to drop.
 
     Examples:
-        "東大OLK / 早大OC" -> ["東大OLK", "早大OC"]
-        "京大OLC, 同志社OLC" -> ["京大OLC", "同志社OLC"]
-        "東工大OLC1" -> ["東工大OLC"]
+        "東大OLK / 早大OC" -> ("東大OLK", "早大OC")
+        "京大OLC, 同志社OLC" -> ("京大OLC", "同志社OLC")
+        "東工大OLC1" -> ("東工大OLC",)
     """
     if not affiliation or affiliation in ['-', '−', '―', '']:
-        return []
+        return ()
 
-    # Split by / or ,
-    parts = re.split(r'[/,、]', affiliation)
+    affiliation = normalize_whitespace(affiliation)
 
+    # One regex scan extracts each part between / , 、 separators with
+    # trailing numbers already stripped (e.g., "東工大OLC1" -> "東工大OLC")
     result = []
-    for part in parts:
-        part = normalize_whitespace(part)
-        if not part or part in ['-', '−', '―']:
-            continue
-
-        # Remove trailing numbers (e.g., "東工大OLC1" -> "東工大OLC")
-        part = re.sub(r'\d+$', '', part)
+    for part in _AFFIL_PART_RE.findall(affiliation):
         part = part.strip()
-
-        if part:
+        if part and not part.isdigit() and part not in ['-', '−', '―']:
             result.append(part)
 
-    return result
-
-
-def detect_encoding(file_path: str) -> str:
-    """Detect file encoding by trying common encodings."""
-    encodings = ['utf-8-sig', 'utf-8', 'cp932', 'shift_jis', 'euc-jp']
-
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                f.read(1024)
-            return encoding
-        except (UnicodeDecodeError, UnicodeError):
-            continue
+    return tuple(result)
 
-    return 'utf-8-sig'  # Default fallback
 
+def detect_encoding_and_delimiter(file_path: str) -> tuple:
+    """
+    Detect file encoding and CSV delimiter (tab or comma) in one pass.
 
-def detect_delimiter(file_path: str, encoding: str) -> str:
-    """Detect CSV delimiter (tab or comma)."""
-    with open(file_path, 'r', encoding=encoding) as f:
-        first_line = f.readline()
+    Reads a single sample of the file as bytes, checks for a BOM first
+    (definitive and free), then tries decoding the sample in memory with
+    common encodings. Returns (encoding, delimiter).
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read(65536)
+
+    # BOM fast-path
+    if data.startswith(b'\xef\xbb\xbf'):
+        encoding = 'utf-8-sig'
+    elif data.startswith(b'\xff\xfe') or data.startswith(b'\xfe\xff'):
+        encoding = 'utf-16'
+    elif data.isascii():
+        # No BOM and no high bytes: every candidate decodes this
+        # identically, so skip the decode loop
+        encoding = 'utf-8'
+    elif HAS_CHARDET and (guess := chardet.detect(data)).get('confidence', 0) > 0.7:
+        # Single pass of a trained detector beats speculative decoding
+        encoding = guess['encoding']
+    else:
+        # No BOM: try candidates in order. utf-8 stays first because its
+        # validation is discriminating (Shift-JIS byte pairs are almost
+        # never valid utf-8), while cp932 accepts most byte streams and
+        # would misdetect utf-8 files if tried earlier.
+        encoding = 'utf-8-sig'  # Default fallback
+        for candidate in ['utf-8', 'cp932', 'shift_jis', 'euc-jp']:
+            try:
+                # Incremental decode tolerates a multi-byte character cut
+                # off at the end of the sample
+                codecs.getincrementaldecoder(candidate)().decode(data, False)
+                encoding = candidate
+                break
+            except (UnicodeDecodeError, UnicodeError):
+                continue
 
-    tab_count = first_line.count('\t')
-    comma_count = first_line.count(',')
+    sample = data.decode(encoding, errors='ignore')
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters='\t,').delimiter
+    except csv.Error:
+        # Sniffer needs well-formed sample data; fall back to counting
+        first_line = sample.split('\n', 1)[0]
+        delimiter = '\t' if first_line.count('\t') > first_line.count(',') else ','
 
-    return '\t' if tab_count > comma_count else ','
+    return encoding, delimiter
 
 
 def find_column_indices(header_row: List[str], column_names_row: List[str]) -> Dict[str, int]:
@@ -104,6 +165,10 @@ def find_column_indices(header_row: List[str], column_names_row: List[str]) -> D
     """
     indices = {}
 
+    # Normalize the column-names row once; it is scanned again for every
+    # participant section below
+    normalized_cols = [normalize_whitespace(c) for c in column_names_row]
+
     # Find team/class columns (in チーム(組) section)
     team_start = -1
     for i, h in enumerate(header_row):
@@ -114,18 +179,22 @@ def find_column_indices(header_row: List[str], column_names_row: List[str]) -> D
     # Find participant sections (1人目, 2人目, ...)
     participant_starts = {}
     for i, h in enumerate(header_row):
-        match = re.match(r'(\d+)人目', h)
+        match = _PARTICIPANT_RE.match(h)
         if match:
             num = int(match.group(1))
             if num not in participant_starts:
                 participant_starts[num] = i
 
-    # Map column names to indices within each section
-    for i, col_name in enumerate(column_names_row):
-        col_name = normalize_whitespace(col_name)
+    # Precompute section boundaries: the team section ends where the first
+    # participant section begins, and each participant section ends at the
+    # next one's start
+    starts_sorted = sorted(participant_starts.items(), key=lambda x: x[1])
+    team_end = starts_sorted[0][1] if starts_sorted else len(column_names_row)
 
+    # Map column names to indices within each section
+    for i, col_name in enumerate(normalized_cols):
         # Team section columns
-        if team_start <= i < min(participant_starts.values(), default=len(column_names_row)):
+        if team_start <= i < team_end:
             if col_name == 'クラス':
                 indices['class'] = i
             elif col_name == '所属':
@@ -136,15 +205,15 @@ def find_column_indices(header_row: List[str], column_names_row: List[str]) -> D
                 indices['rental_count'] = i
 
     # Participant columns
-    for p_num, p_start in participant_starts.items():
-        p_end = min([v for v in participant_starts.values() if v > p_start],
-                    default=len(column_names_row))
+    for pos, (p_num, p_start) in enumerate(starts_sorted):
+        p_end = (starts_sorted[pos + 1][1] if pos + 1 < len(starts_sorted)
+                 else len(column_names_row))
 
         prefix = f'p{p_num}_'
         for i in range(p_start, p_end):
-            if i >= len(column_names_row):
+            if i >= len(normalized_cols):
                 break
-            col_name = normalize_whitespace(column_names_row[i])
+            col_name = normalized_cols[i]
 
             if col_name == '氏名1':
                 indices[f'{prefix}name1'] = i
@@ -160,117 +229,149 @@ def find_column_indices(header_row: List[str], column_names_row: List[str]) -> D
     return indices
 
 
-def parse_entry_list(file_path: str) -> List[Dict[str, Any]]:
+def parse_entry_list(file_path: str) -> List[Entry]:
     """
     Parse JOY entry list CSV and extract participant information.
 
-    Returns a list of dictionaries, each containing:
+    Returns a list of Entry records, each containing:
     - class_name: Competition class (e.g., "M21A", "W20E")
     - name1: Name in kanji
     - name2: Name in hiragana/katakana
     - affiliation: Club/team affiliation
-    - affiliations: List of parsed affiliations (for split detection)
+    - affiliations: Tuple of parsed affiliations (for split detection)
     - card_number: SI card number
     - joa_number: JOA registration number
     - is_rental: Whether card is rental
     - gender: M/W
     """
-    encoding = detect_encoding(file_path)
-    delimiter = detect_delimiter(file_path, encoding)
+    encoding, delimiter = detect_encoding_and_delimiter(file_path)
 
     entries = []
 
     with open(file_path, 'r', encoding=encoding, newline='') as f:
         reader = csv.reader(f, delimiter=delimiter)
-        rows = list(reader)
-
-    if len(rows) < 3:
-        raise ValueError("Entry list must have at least 3 rows (2 header rows + data)")
-
-    header_row = rows[0]
-    column_names_row = rows[1]
-    data_rows = rows[2:]
-
-    indices = find_column_indices(header_row, column_names_row)
-
-    def safe_get(row: List[str], idx: Optional[int], default: str = "") -> str:
-        """Safely get value from row by index."""
-        if idx is None or idx >= len(row):
-            return default
-        val = row[idx]
-        return normalize_whitespace(val) if val else default
 
-    for row_num, row in enumerate(data_rows, start=3):
-        if not row or all(not cell.strip() for cell in row):
-            continue
-
-        # Get class and affiliation from team section
-        class_name = safe_get(row, indices.get('class'))
-        affiliation = safe_get(row, indices.get('affiliation'))
-        rental_count_str = safe_get(row, indices.get('rental_count'), '0')
-
-        # Skip rows without class
-        if not class_name or class_name == '〃':
-            # Handle continuation rows (〃 means same as above)
-            # These need special handling - class should be taken from row
-            pass
-
-        # Parse each participant in the row
-        for p_num in range(1, 6):
-            prefix = f'p{p_num}_'
-
-            name1 = safe_get(row, indices.get(f'{prefix}name1'))
-            if not name1:
-                continue  # No participant in this slot
-
-            name2 = safe_get(row, indices.get(f'{prefix}name2'))
-            gender = safe_get(row, indices.get(f'{prefix}gender'))
-            card_number = safe_get(row, indices.get(f'{prefix}card_number'))
-            joa_number = safe_get(row, indices.get(f'{prefix}joa_number'))
-
-            # Determine if rental card
+        try:
+            header_row = next(reader)
+            column_names_row = next(reader)
+        except StopIteration:
+            raise ValueError("Entry list must have at least 3 rows (2 header rows + data)")
+
+        indices = find_column_indices(header_row, column_names_row)
+
+        # Resolve team-section indices to locals so the row loop avoids
+        # string-keyed dict lookups entirely. Missing columns map to a
+        # sentinel slot past every real column; rows are padded with empty
+        # cells up to that slot, so every lookup is a plain list index with
+        # no None or bounds check per cell.
+        known_indices = [i for i in indices.values() if i is not None]
+        sentinel = max(known_indices, default=0) + 1
+        pad_len = sentinel + 1
+
+        class_idx = indices.get('class', sentinel)
+        affiliation_idx = indices.get('affiliation', sentinel)
+        rental_idx = indices.get('rental_count', sentinel)
+
+        # Resolve participant column indices once; the row loop iterates
+        # these tuples instead of rebuilding key strings per row
+        participant_indices = [
+            (p_num,
+             indices.get(f'p{p_num}_name1', sentinel),
+             indices.get(f'p{p_num}_name2', sentinel),
+             indices.get(f'p{p_num}_gender', sentinel),
+             indices.get(f'p{p_num}_card_number', sentinel),
+             indices.get(f'p{p_num}_joa_number', sentinel))
+            for p_num in range(1, 6)
+        ]
+
+        for row_num, row in enumerate(reader, start=3):
+            # Skip blank rows; short-circuits on the first non-blank cell
+            # without allocating per-cell stripped copies
+            if not row or not any(cell and not cell.isspace() for cell in row):
+                continue
+
+            if len(row) < pad_len:
+                row = row + [''] * (pad_len - len(row))
+            elif row[sentinel]:
+                # Long rows may have a real (unrecognized) column at the
+                # sentinel slot; blank it so missing-column reads stay empty
+                row[sentinel] = ''
+
+            # Get class and affiliation from team section
+            val = row[class_idx]
+            class_name = normalize_whitespace(val) if val else ''
+            val = row[affiliation_idx]
+            affiliation = normalize_whitespace(val) if val else ''
+            val = row[rental_idx]
+            rental_count_str = normalize_whitespace(val) if val else '0'
+
+            # Skip rows without class
+            if not class_name or class_name == '〃':
+                # Handle continuation rows (〃 means same as above)
+                # These need special handling - class should be taken from row
+                pass
+
+            # Row-level invariants: identical for every participant slot
             try:
                 rental_count = int(rental_count_str) if rental_count_str else 0
             except ValueError:
                 rental_count = 0
-            is_rental = rental_count > 0 and not card_number
 
             # Parse affiliations for split detection
             affiliations = parse_affiliation(affiliation)
 
-            entry = {
-                'class_name': class_name,
-                'name1': name1,
-                'name2': name2,
-                'affiliation': affiliation if affiliation and affiliation != '-' else '',
-                'affiliations': affiliations,
-                'card_number': card_number,
-                'joa_number': joa_number,
-                'is_rental': is_rental,
-                'gender': gender,
-                'row_number': row_num,
-                'participant_number': p_num
-            }
-
-            entries.append(entry)
+            # Shared entry fields, computed once per row
+            row_affiliation = affiliation if affiliation and affiliation != '-' else ''
+
+            # Parse each participant in the row
+            for p_num, name1_idx, name2_idx, gender_idx, card_idx, joa_idx in participant_indices:
+                val = row[name1_idx]
+                name1 = normalize_whitespace(val) if val else ''
+                if not name1:
+                    continue  # No participant in this slot
+
+                val = row[name2_idx]
+                name2 = normalize_whitespace(val) if val else ''
+                val = row[gender_idx]
+                gender = normalize_whitespace(val) if val else ''
+                val = row[card_idx]
+                card_number = normalize_whitespace(val) if val else ''
+                val = row[joa_idx]
+                joa_number = normalize_whitespace(val) if val else ''
+
+                # Determine if rental card
+                is_rental = rental_count > 0 and not card_number
+
+                entries.append(Entry(
+                    class_name=class_name,
+                    name1=name1,
+                    name2=name2,
+                    affiliation=row_affiliation,
+                    affiliations=affiliations,
+                    card_number=card_number,
+                    joa_number=joa_number,
+                    is_rental=is_rental,
+                    gender=gender,
+                    row_number=row_num,
+                    participant_number=p_num
+                ))
 
     return entries
 
 
-def group_entries_by_class(entries: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+def group_entries_by_class(entries: List[Entry]) -> Dict[str, List[Entry]]:
     """Group entries by their class name."""
-    groups = {}
+    groups = defaultdict(list)
     for entry in entries:
-        class_name = entry['class_name']
-        if class_name not in groups:
-            groups[class_name] = []
-        groups[class_name].append(entry)
+        groups[entry.class_name].append(entry)
     return groups
 
 
-def get_unique_classes(entries: List[Dict[str, Any]]) -> List[str]:
-    """Get unique class names from entries."""
-    return list(set(entry['class_name'] for entry in entries if entry['class_name']))
+def get_unique_classes(entries: List[Entry]) -> List[str]:
+    """Get unique class names from entries, in first-seen order."""
+    return list(dict.fromkeys(
+        entry.class_name for entry in entries if entry.class_name
+    ))
 
 
 if __name__ == '__main__':
@@ -290,4 +391,4 @@ if __name__ == '__main__':
         # Show first few entries
         print("\nFirst 5 entries:")
         for entry in entries[:5]:
-            print(f"  {entry['class_name']}: {entry['name1']} ({entry['affiliation']})")
+            print(f"  {entry.class_name}: {entry.name1} ({entry.affiliation})")
@@ -15,21 +15,23 @@ Author: Generated for orienteering competition management
 """
 
 import argparse
+import heapq
 import json
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 
-from entry_parser import parse_entry_list
+from entry_parser import Entry, parse_entry_list
 from ranking_fetcher import fetch_rankings, get_joa_registration
 from startlist_generator import generate_startlist
 from output_formatter import (
-    write_startlist_csv,
-    write_role_startlist_csv,
+    group_startlist_by_lane,
+    write_csv_outputs,
     write_public_startlist_tex,
-    write_role_startlist_tex,
-    write_class_summary_csv
+    write_role_startlist_tex
 )
 
 
@@ -90,11 +92,11 @@ def validate_config(config: dict) -> bool:
 
 
 def apply_class_splits(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     splits_config: Dict[str, Dict[str, Any]],
     rankings: Dict[str, Dict[str, int]],
     seed: Optional[int] = None
-) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+) -> Tuple[List[Entry], Dict[str, List[str]]]:
     """
     Apply class splits to entries before lane processing.
 
@@ -109,19 +111,17 @@ def apply_class_splits(
     from startlist_generator import split_class_by_ranking
     import random
 
-    if seed is not None:
-        random.seed(seed)
+    # Local RNG instance: no global random state is touched, so repeated
+    # calls and parallel callers stay independent and reproducible
+    rng = random.Random(seed)
 
     updated_entries = []
     split_mapping = {}
 
     # Group entries by class
-    entries_by_class = {}
+    entries_by_class = defaultdict(list)
     for entry in entries:
-        class_name = entry.get('class_name', '')
-        if class_name not in entries_by_class:
-            entries_by_class[class_name] = []
-        entries_by_class[class_name].append(entry)
+        entries_by_class[entry.class_name].append(entry)
 
     for class_name, class_entries in entries_by_class.items():
         # Check if this class is configured for splitting
@@ -135,7 +135,7 @@ def apply_class_splits(
 
             # Split by ranking
             groups = split_class_by_ranking(
-                class_entries, split_count, class_rankings, seed
+                class_entries, split_count, class_rankings, rng
             )
 
             # Generate split class names
@@ -146,14 +146,14 @@ def apply_class_splits(
 
             split_mapping[class_name] = split_names
 
-            # Update entries with split class names
+            # Update entries with split class names. Mutating in place is
+            # safe: the caller replaces its entries list with the result.
             for group_num, group_entries in enumerate(groups, start=1):
                 split_name = f"{class_name}{suffix_format.format(group_num)}"
                 for entry in group_entries:
-                    updated_entry = entry.copy()
-                    updated_entry['class_name'] = split_name
-                    updated_entry['original_class'] = class_name
-                    updated_entries.append(updated_entry)
+                    entry.class_name = split_name
+                    entry.original_class = class_name
+                    updated_entries.append(entry)
         else:
             # No splitting, keep original class
             updated_entries.extend(class_entries)
@@ -232,32 +232,33 @@ def main():
     os.makedirs(output_folder, exist_ok=True)
     print(f"Output directory: {output_folder}")
 
-    # Generate startlist for each lane
-    all_startlists = {}
-    for lane_name, lane_config in config['lanes'].items():
-        print(f"\nProcessing {lane_name}...")
-
-        # For lanes, don't apply splits again (already applied)
-        startlist = generate_startlist(
-            entries=entries,
-            lane_config=lane_config,
-            class_overrides=config.get('class_overrides', {}),
-            splits_config={},  # Empty - splits already applied
-            rankings=rankings,
-            joa_data=joa_data,
-            seed=args.seed
-        )
-
-        all_startlists[lane_name] = startlist
-        print(f"  Generated {len(startlist)} start positions")
+    # Generate startlists for all lanes. Each lane only reads the shared
+    # entries/rankings/joa_data, so lanes run in parallel across cores.
+    print(f"\nProcessing {len(config['lanes'])} lanes...")
+    with ProcessPoolExecutor() as executor:
+        futures = {
+            lane_name: executor.submit(
+                generate_startlist,
+                entries=entries,
+                lane_config=lane_config,
+                class_overrides=config.get('class_overrides', {}),
+                splits_config={},  # Empty - splits already applied
+                rankings=rankings,
+                joa_data=joa_data,
+                seed=args.seed
+            )
+            for lane_name, lane_config in config['lanes'].items()
+        }
+        all_startlists = {name: f.result() for name, f in futures.items()}
 
-    # Combine all startlists
-    combined_startlist = []
     for lane_name, startlist in all_startlists.items():
-        combined_startlist.extend(startlist)
+        print(f"  {lane_name}: {len(startlist)} start positions")
 
-    # Sort by start time
-    combined_startlist.sort(key=lambda x: x['start_time'])
+    # Combine all startlists, ordered by start time. Each lane's startlist
+    # is already time-ordered, so an O(N) merge replaces a full sort.
+    combined_startlist = list(heapq.merge(
+        *all_startlists.values(), key=lambda x: x['start_time']
+    ))
 
     # Write output files
     startlist_path = os.path.join(output_folder, 'Startlist.csv')
@@ -267,21 +268,23 @@ def main():
     class_summary_path = os.path.join(output_folder, 'Class_Summary.csv')
 
     print(f"\nWriting output files...")
-    write_startlist_csv(combined_startlist, startlist_path)
+    # The three CSV outputs share one pass over the combined startlist
+    write_csv_outputs(
+        combined_startlist, startlist_path, role_startlist_path, class_summary_path
+    )
     print(f"  Created: {startlist_path}")
-
-    write_role_startlist_csv(combined_startlist, role_startlist_path)
     print(f"  Created: {role_startlist_path}")
+    print(f"  Created: {class_summary_path}")
+
+    # Both TeX writers share one lane grouping
+    by_lane = group_startlist_by_lane(combined_startlist, config.get('lanes', {}))
 
-    write_public_startlist_tex(combined_startlist, public_tex_path, config)
+    write_public_startlist_tex(combined_startlist, public_tex_path, config, by_lane)
     print(f"  Created: {public_tex_path}")
 
-    write_role_startlist_tex(combined_startlist, role_tex_path, config)
+    write_role_startlist_tex(combined_startlist, role_tex_path, config, by_lane)
     print(f"  Created: {role_tex_path}")
 
-    write_class_summary_csv(combined_startlist, class_summary_path)
-    print(f"  Created: {class_summary_path}")
-
     print(f"\nDone! Total entries: {len(combined_startlist)}")
 
 
@@ -10,6 +10,10 @@ Generates output files in various formats:
 
 import csv
 import os
+import re
+from contextlib import ExitStack
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Any
 from collections import defaultdict
 
@@ -41,6 +45,65 @@ LABELS = {
 }
 
 
+# Column headers for the two startlist CSV formats
+STARTLIST_FIELDNAMES = [
+    'クラス',
+    'スタートナンバー',
+    '氏名１',
+    '氏名2',
+    '所属',
+    'スタート時刻',
+    'カード番号',
+    'カード備考',
+    '競技者登録番号'
+]
+
+ROLE_FIELDNAMES = [
+    'クラス',
+    'スタートナンバー',
+    '氏名',
+    '所属',
+    'スタート時刻',
+    'カード番号',
+    'チェックイン',
+    '備考'
+]
+
+
+def _startlist_row(entry: Dict[str, Any]) -> tuple:
+    """Project one startlist entry into a Mulka CSV row (field order)."""
+    # Determine card note
+    card_note = 'レンタル' if entry.get('is_rental', False) else 'my card'
+    if not entry.get('card_number'):
+        card_note = 'レンタル'
+
+    return (
+        entry.get('class_name', ''),
+        entry.get('start_number', ''),
+        entry.get('name1', ''),
+        entry.get('name2', ''),
+        entry.get('affiliation', '-') or '-',
+        entry.get('start_time', ''),
+        entry.get('card_number', ''),
+        card_note,
+        entry.get('joa_number', '')
+    )
+
+
+def _role_row(entry: Dict[str, Any]) -> tuple:
+    """Project one startlist entry into a role CSV row (field order)."""
+    return (
+        entry.get('class_name', ''),
+        entry.get('start_number', ''),
+        entry.get('name1', ''),
+        entry.get('affiliation', '-') or '-',
+        entry.get('start_time', ''),
+        entry.get('card_number', ''),
+        '',
+        'レンタル' if entry.get('is_rental', False) else ''
+    )
+
+
 def write_startlist_csv(startlist: List[Dict[str, Any]], output_path: str) -> None:
     """
     Write startlist in Mulka-compatible CSV format.
@@ -56,40 +119,10 @@ def write_startlist_csv(startlist: List[Dict[str, Any]], output_path: str) -> No
     - Card Note (カード備考)
     - Registration Number (競技者登録番号)
     """
-    fieldnames = [
-        'クラス',
-        'スタートナンバー',
-        '氏名１',
-        '氏名2',
-        '所属',
-        'スタート時刻',
-        'カード番号',
-        'カード備考',
-        '競技者登録番号'
-    ]
-
-    with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for entry in startlist:
-            # Determine card note
-            card_note = 'レンタル' if entry.get('is_rental', False) else 'my card'
-            if not entry.get('card_number'):
-                card_note = 'レンタル'
-
-            row = {
-                'クラス': entry.get('class_name', ''),
-                'スタートナンバー': entry.get('start_number', ''),
-                '氏名１': entry.get('name1', ''),
-                '氏名2': entry.get('name2', ''),
-                '所属': entry.get('affiliation', '-') or '-',
-                'スタート時刻': entry.get('start_time', ''),
-                'カード番号': entry.get('card_number', ''),
-                'カード備考': card_note,
-                '競技者登録番号': entry.get('joa_number', '')
-            }
-            writer.writerow(row)
+    with open(output_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(STARTLIST_FIELDNAMES)
+        writer.writerows(_startlist_row(entry) for entry in startlist)
 
 
 def write_role_startlist_csv(startlist: List[Dict[str, Any]], output_path: str) -> None:
@@ -98,58 +131,86 @@ def write_role_startlist_csv(startlist: List[Dict[str, Any]], output_path: str)
 
     Additional columns for role management and check-in status.
     """
-    fieldnames = [
-        'クラス',
-        'スタートナンバー',
-        '氏名',
-        '所属',
-        'スタート時刻',
-        'カード番号',
-        'チェックイン',
-        '備考'
-    ]
+    with open(output_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(ROLE_FIELDNAMES)
+        writer.writerows(_role_row(entry) for entry in startlist)
+
+
+def write_csv_outputs(
+    startlist: List[Dict[str, Any]],
+    startlist_path: str,
+    role_path: str,
+    summary_path: str
+) -> None:
+    """
+    Write the main, role, and class-summary CSVs in a single pass.
+
+    Fans each entry out to all open writers instead of iterating the
+    startlist once per output file.
+    """
+    by_class = defaultdict(int)
+
+    with ExitStack() as stack:
+        startlist_f = stack.enter_context(
+            open(startlist_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20))
+        role_f = stack.enter_context(
+            open(role_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20))
 
-    with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        startlist_writer = csv.writer(startlist_f)
+        startlist_writer.writerow(STARTLIST_FIELDNAMES)
+        role_writer = csv.writer(role_f)
+        role_writer.writerow(ROLE_FIELDNAMES)
 
         for entry in startlist:
-            row = {
-                'クラス': entry.get('class_name', ''),
-                'スタートナンバー': entry.get('start_number', ''),
-                '氏名': entry.get('name1', ''),
-                '所属': entry.get('affiliation', '-') or '-',
-                'スタート時刻': entry.get('start_time', ''),
-                'カード番号': entry.get('card_number', ''),
-                'チェックイン': '',
-                '備考': 'レンタル' if entry.get('is_rental', False) else ''
-            }
-            writer.writerow(row)
+            startlist_writer.writerow(_startlist_row(entry))
+            role_writer.writerow(_role_row(entry))
+            class_name = entry.get('class_name', '')
+            if class_name:
+                by_class[class_name] += 1
 
+    _write_class_summary(by_class, summary_path)
 
-def escape_latex(text: str) -> str:
-    """Escape special LaTeX characters."""
-    if not text:
-        return ''
-
-    # Characters that need escaping in LaTeX
-    replacements = [
-        ('\\', r'\textbackslash{}'),
-        ('&', r'\&'),
-        ('%', r'\%'),
-        ('$', r'\$'),
-        ('#', r'\#'),
-        ('_', r'\_'),
-        ('{', r'\{'),
-        ('}', r'\}'),
-        ('~', r'\textasciitilde{}'),
-        ('^', r'\textasciicircum{}'),
-    ]
 
-    for old, new in replacements:
-        text = text.replace(old, new)
+# First run of digits in a lane name, for natural ordering
+_LANE_NUM_RE = re.compile(r'(\d+)')
+
+
+def _lane_sort_key(lane_name: str):
+    """Sort lanes naturally (Lane 1, Lane 2, ...; non-numbered lanes last)."""
+    m = _LANE_NUM_RE.search(lane_name)
+    return (int(m.group(1)) if m else 999, lane_name)
+
+
+# Key for ordering entries within a class; bound once instead of a fresh
+# lambda per class sort
+_START_NUMBER_KEY = itemgetter('start_number')
+
 
-    return text
+# Characters that need escaping in LaTeX, as a translation table so
+# escaping is a single C-level pass instead of one .replace() per character
+_LATEX_TRANS = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+})
+
+
+@lru_cache(maxsize=8192)
+def escape_latex(text: str) -> str:
+    """Escape special LaTeX characters.
+
+    Memoized: class names, affiliations and repeat runners recur many
+    times across the TeX outputs.
+    """
+    return text.translate(_LATEX_TRANS) if text else ''
 
 
 def get_lane_for_class(class_name: str, lanes_config: Dict[str, Any]) -> str:
@@ -165,10 +226,76 @@ def get_lane_for_class(class_name: str, lanes_config: Dict[str, Any]) -> str:
     return ''
 
 
+def group_startlist_by_lane(
+    startlist: List[Dict[str, Any]],
+    lanes_config: Dict[str, Any]
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Group startlist entries by lane, then by class within each lane.
+
+    Lane resolution is memoized per class name, and callers producing
+    several outputs can compute the grouping once and pass it to each
+    TeX writer instead of re-grouping per writer.
+    """
+    # Build a lookup table once instead of scanning every lane's class
+    # list per entry: exact matches resolve with one dict probe, split
+    # classes fall back to a longest-prefix scan over configured classes
+    exact = {}
+    prefixes = []
+    for lane_name, lane_config in lanes_config.items():
+        for cls in lane_config.get('classes', []):
+            if cls not in exact:
+                exact[cls] = lane_name
+            prefixes.append((cls, lane_name))
+    prefixes.sort(key=lambda x: -len(x[0]))  # Longest prefix wins
+
+    by_lane = defaultdict(lambda: defaultdict(list))
+    lane_cache = {}
+
+    for entry in startlist:
+        class_name = entry.get('class_name', '')
+        lane_name = lane_cache.get(class_name)
+        if lane_name is None:
+            lane_name = exact.get(class_name) or next(
+                (lane for cls, lane in prefixes if class_name.startswith(cls)),
+                'Other'
+            )
+            lane_cache[class_name] = lane_name
+        by_lane[lane_name][class_name].append(entry)
+
+    # Sort each class group by start number here, once, so every writer
+    # consuming the grouping gets ordered entries without re-sorting
+    for classes_in_lane in by_lane.values():
+        for entries in classes_in_lane.values():
+            entries.sort(key=_START_NUMBER_KEY)
+
+    return by_lane
+
+
+# LaTeX preamble with ltjsarticle for LuaLaTeX, shared by both TeX
+# writers; the role variant adds furigana support
+_PUBLIC_PREAMBLE = r'''\documentclass[a4paper,10pt]{ltjsarticle}
+\usepackage{geometry}
+\usepackage{longtable}
+\usepackage{booktabs}
+\usepackage{fancyhdr}
+
+\geometry{margin=2cm}
+\pagestyle{fancy}
+\fancyhf{}
+'''
+
+_ROLE_PREAMBLE = _PUBLIC_PREAMBLE.replace(
+    '\\usepackage{fancyhdr}\n',
+    '\\usepackage{fancyhdr}\n\\usepackage{luatexja-ruby}\n'
+)
+
+
 def write_public_startlist_tex(
     startlist: List[Dict[str, Any]],
     output_path: str,
-    config: Dict[str, Any]
+    config: Dict[str, Any],
+    by_lane: Dict[str, Dict[str, List[Dict[str, Any]]]] = None
 ) -> None:
     """
     Write public startlist in LaTeX format.
@@ -186,93 +313,71 @@ def write_public_startlist_tex(
     output_folder = config.get('output_folder', '')
     lanes_config = config.get('lanes', {})
 
-    # Group entries by lane, then by class
-    by_lane = defaultdict(lambda: defaultdict(list))
-    for entry in startlist:
-        class_name = entry.get('class_name', '')
-        lane_name = get_lane_for_class(class_name, lanes_config)
-        if not lane_name:
-            lane_name = 'Other'
-        by_lane[lane_name][class_name].append(entry)
+    # Group entries by lane, then by class (unless precomputed)
+    if by_lane is None:
+        by_lane = group_startlist_by_lane(startlist, lanes_config)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Write LaTeX preamble with ltjsarticle for LuaLaTeX
-        f.write(r'''\documentclass[a4paper,10pt]{ltjsarticle}
-\usepackage{geometry}
-\usepackage{longtable}
-\usepackage{booktabs}
-\usepackage{fancyhdr}
+    # Build the document in memory and write it in one buffered burst
+    # instead of issuing many small write() calls
+    parts = []
+    append = parts.append
 
-\geometry{margin=2cm}
-\pagestyle{fancy}
-\fancyhf{}
-''')
-        f.write(f'\\fancyhead[C]{{{escape_latex(competition_name)} - {labels["startlist"]}}}\n')
-        f.write(r'\fancyfoot[C]{\thepage}')
-        f.write('\n')
-        f.write(r'\setlength{\headheight}{15pt}')
-        f.write('\n')
-        f.write(r'\begin{document}')
-        f.write('\n\n')
-
-        # Title
-        f.write(f'\\section*{{{escape_latex(output_folder)} {labels["startlist"]}}}\n\n')
-
-        # Sort lanes naturally (Lane 1, Lane 2, ...)
-        sorted_lanes = sorted(by_lane.keys(), key=lambda x: (
-            int(''.join(filter(str.isdigit, x)) or '999'),
-            x
-        ))
-
-        # Write each lane section
-        for lane_name in sorted_lanes:
-            classes_in_lane = by_lane[lane_name]
-
-            # Lane header
-            f.write(f'\\section*{{{escape_latex(lane_name)}}}\n\n')
-
-            # Write each class within this lane
-            for class_name in sorted(classes_in_lane.keys()):
-                entries = classes_in_lane[class_name]
-                entries.sort(key=lambda x: x.get('start_number', 0))
-
-                entry_count_label = f'{len(entries)} {labels["entries"]}'
-                f.write(f'\\subsection*{{{escape_latex(class_name)} ({entry_count_label})}}\n\n')
-
-                f.write(r'\begin{longtable}{rllll}')
-                f.write('\n')
-                f.write(r'\toprule')
-                f.write('\n')
-                f.write(f'{labels["no"]} & {labels["time"]} & {labels["name"]} & {labels["affiliation"]} & {labels["card"]} \\\\\n')
-                f.write(r'\midrule')
-                f.write('\n')
-                f.write(r'\endhead')
-                f.write('\n')
-
-                for entry in entries:
-                    start_num = entry.get('start_number', '')
-                    start_time = entry.get('start_time', '')
-                    name = escape_latex(entry.get('name1', ''))
-                    affiliation = escape_latex(entry.get('affiliation', '-') or '-')
-                    card = entry.get('card_number', '')
-                    if entry.get('is_rental', False) or not card:
-                        card = labels['rental']
-
-                    f.write(f'{start_num} & {start_time} & {name} & {affiliation} & {card} \\\\\n')
-
-                f.write(r'\bottomrule')
-                f.write('\n')
-                f.write(r'\end{longtable}')
-                f.write('\n\n')
-
-        f.write(r'\end{document}')
-        f.write('\n')
+    append(_PUBLIC_PREAMBLE)
+    append(f'\\fancyhead[C]{{{escape_latex(competition_name)} - {labels["startlist"]}}}\n')
+    append('\\fancyfoot[C]{\\thepage}\n')
+    append('\\setlength{\\headheight}{15pt}\n')
+    append('\\begin{document}\n\n')
+
+    # Title
+    append(f'\\section*{{{escape_latex(output_folder)} {labels["startlist"]}}}\n\n')
+
+    sorted_lanes = sorted(by_lane.keys(), key=_lane_sort_key)
+
+    # Write each lane section
+    for lane_name in sorted_lanes:
+        classes_in_lane = by_lane[lane_name]
+
+        # Lane header
+        append(f'\\section*{{{escape_latex(lane_name)}}}\n\n')
+
+        # Write each class within this lane
+        for class_name in sorted(classes_in_lane.keys()):
+            entries = classes_in_lane[class_name]
+
+            entry_count_label = f'{len(entries)} {labels["entries"]}'
+            append(f'\\subsection*{{{escape_latex(class_name)} ({entry_count_label})}}\n\n')
+
+            append('\\begin{longtable}{rllll}\n')
+            append('\\toprule\n')
+            append(f'{labels["no"]} & {labels["time"]} & {labels["name"]} & {labels["affiliation"]} & {labels["card"]} \\\\\n')
+            append('\\midrule\n')
+            append('\\endhead\n')
+
+            for entry in entries:
+                start_num = entry.get('start_number', '')
+                start_time = entry.get('start_time', '')
+                name = escape_latex(entry.get('name1', ''))
+                affiliation = escape_latex(entry.get('affiliation', '-') or '-')
+                card = entry.get('card_number', '')
+                if entry.get('is_rental', False) or not card:
+                    card = labels['rental']
+
+                append(f'{start_num} & {start_time} & {name} & {affiliation} & {card} \\\\\n')
+
+            append('\\bottomrule\n')
+            append('\\end{longtable}\n\n')
+
+    append('\\end{document}\n')
+
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(''.join(parts))
 
 
 def write_role_startlist_tex(
     startlist: List[Dict[str, Any]],
     output_path: str,
-    config: Dict[str, Any]
+    config: Dict[str, Any],
+    by_lane: Dict[str, Dict[str, List[Dict[str, Any]]]] = None
 ) -> None:
     """
     Write role startlist in LaTeX format with furigana.
@@ -286,95 +391,83 @@ def write_role_startlist_tex(
     output_folder = config.get('output_folder', '')
     lanes_config = config.get('lanes', {})
 
-    # Group entries by lane, then by class
-    by_lane = defaultdict(lambda: defaultdict(list))
-    for entry in startlist:
-        class_name = entry.get('class_name', '')
-        lane_name = get_lane_for_class(class_name, lanes_config)
-        if not lane_name:
-            lane_name = 'Other'
-        by_lane[lane_name][class_name].append(entry)
+    # Group entries by lane, then by class (unless precomputed)
+    if by_lane is None:
+        by_lane = group_startlist_by_lane(startlist, lanes_config)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # Write LaTeX preamble with ltjsarticle for LuaLaTeX
-        f.write(r'''\documentclass[a4paper,10pt]{ltjsarticle}
-\usepackage{geometry}
-\usepackage{longtable}
-\usepackage{booktabs}
-\usepackage{fancyhdr}
-\usepackage{luatexja-ruby}
+    # Build the document in memory and write it in one buffered burst
+    parts = []
+    append = parts.append
 
-\geometry{margin=2cm}
-\pagestyle{fancy}
-\fancyhf{}
-''')
-        f.write(f'\\fancyhead[C]{{{escape_latex(competition_name)} - 役員用スタートリスト}}\n')
-        f.write(r'\fancyfoot[C]{\thepage}')
-        f.write('\n')
-        f.write(r'\setlength{\headheight}{15pt}')
-        f.write('\n')
-        f.write(r'\begin{document}')
-        f.write('\n\n')
-
-        # Title
-        f.write(f'\\section*{{{escape_latex(output_folder)} 役員用スタートリスト}}\n\n')
-
-        # Sort lanes naturally (Lane 1, Lane 2, ...)
-        sorted_lanes = sorted(by_lane.keys(), key=lambda x: (
-            int(''.join(filter(str.isdigit, x)) or '999'),
-            x
-        ))
-
-        # Write each lane section
-        for lane_name in sorted_lanes:
-            classes_in_lane = by_lane[lane_name]
-
-            # Lane header
-            f.write(f'\\section*{{{escape_latex(lane_name)}}}\n\n')
-
-            # Write each class within this lane
-            for class_name in sorted(classes_in_lane.keys()):
-                entries = classes_in_lane[class_name]
-                entries.sort(key=lambda x: x.get('start_number', 0))
-
-                f.write(f'\\subsection*{{{escape_latex(class_name)} ({len(entries)}名)}}\n\n')
-
-                f.write(r'\begin{longtable}{rlp{6cm}ll}')
-                f.write('\n')
-                f.write(r'\toprule')
-                f.write('\n')
-                f.write(r'No. & 時刻 & 氏名 & 所属 & カード \\')
-                f.write('\n')
-                f.write(r'\midrule')
-                f.write('\n')
-                f.write(r'\endhead')
-                f.write('\n')
-
-                for entry in entries:
-                    start_num = entry.get('start_number', '')
-                    start_time = entry.get('start_time', '')
-                    name1 = escape_latex(entry.get('name1', ''))
-                    name2 = escape_latex(entry.get('name2', ''))
-                    affiliation = escape_latex(entry.get('affiliation', '-') or '-')
-                    card = entry.get('card_number', '')
-                    if entry.get('is_rental', False) or not card:
-                        card = 'レンタル'
-
-                    # Create name with furigana if name2 exists
-                    if name2 and name1:
-                        name_display = f'\\ruby{{{name1}}}{{{name2}}}'
-                    else:
-                        name_display = name1
-
-                    f.write(f'{start_num} & {start_time} & {name_display} & {affiliation} & {card} \\\\\n')
-
-                f.write(r'\bottomrule')
-                f.write('\n')
-                f.write(r'\end{longtable}')
-                f.write('\n\n')
-
-        f.write(r'\end{document}')
-        f.write('\n')
+    append(_ROLE_PREAMBLE)
+    append(f'\\fancyhead[C]{{{escape_latex(competition_name)} - 役員用スタートリスト}}\n')
+    append('\\fancyfoot[C]{\\thepage}\n')
+    append('\\setlength{\\headheight}{15pt}\n')
+    append('\\begin{document}\n\n')
+
+    # Title
+    append(f'\\section*{{{escape_latex(output_folder)} 役員用スタートリスト}}\n\n')
+
+    sorted_lanes = sorted(by_lane.keys(), key=_lane_sort_key)
+
+    # Write each lane section
+    for lane_name in sorted_lanes:
+        classes_in_lane = by_lane[lane_name]
+
+        # Lane header
+        append(f'\\section*{{{escape_latex(lane_name)}}}\n\n')
+
+        # Write each class within this lane
+        for class_name in sorted(classes_in_lane.keys()):
+            entries = classes_in_lane[class_name]
+
+            append(f'\\subsection*{{{escape_latex(class_name)} ({len(entries)}名)}}\n\n')
+
+            append('\\begin{longtable}{rlp{6cm}ll}\n')
+            append('\\toprule\n')
+            append('No. & 時刻 & 氏名 & 所属 & カード \\\\\n')
+            append('\\midrule\n')
+            append('\\endhead\n')
+
+            for entry in entries:
+                start_num = entry.get('start_number', '')
+                start_time = entry.get('start_time', '')
+                name1 = escape_latex(entry.get('name1', ''))
+                name2 = escape_latex(entry.get('name2', ''))
+                affiliation = escape_latex(entry.get('affiliation', '-') or '-')
+                card = entry.get('card_number', '')
+                if entry.get('is_rental', False) or not card:
+                    card = 'レンタル'
+
+                # Create name with furigana if name2 exists
+                if name2 and name1:
+                    name_display = f'\\ruby{{{name1}}}{{{name2}}}'
+                else:
+                    name_display = name1
+
+                append(f'{start_num} & {start_time} & {name_display} & {affiliation} & {card} \\\\\n')
+
+            append('\\bottomrule\n')
+            append('\\end{longtable}\n\n')
+
+    append('\\end{document}\n')
+
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(''.join(parts))
+
+
+# Semicolon is the Mulka import field separator; occurrences inside
+# fields get turned into commas
+_SEMI_TRANS = str.maketrans({';': ','})
+
+
+def _mulka_import_row(entry: Dict[str, Any]) -> str:
+    """Format one startlist entry as a Mulka import line."""
+    name = entry.get('name1', '').translate(_SEMI_TRANS)
+    club = (entry.get('affiliation', '') or '').translate(_SEMI_TRANS)
+    return (f"{entry.get('class_name', '')};{entry.get('start_number', '')};"
+            f"{name};{club};{entry.get('card_number', '')};"
+            f"{entry.get('start_time', '')}\n")
 
 
 def write_mulka_import_csv(startlist: List[Dict[str, Any]], output_path: str) -> None:
@@ -384,23 +477,26 @@ def write_mulka_import_csv(startlist: List[Dict[str, Any]], output_path: str) ->
     This format uses semicolon separators and specific column ordering
     as required by Mulka software.
     """
-    with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+    with open(output_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
         # Mulka expects: Class;StartNo;Name;Club;CardNo;StartTime
         f.write('Class;StartNo;Name;Club;CardNo;StartTime\n')
+        f.writelines(_mulka_import_row(entry) for entry in startlist)
 
-        for entry in startlist:
-            class_name = entry.get('class_name', '')
-            start_no = entry.get('start_number', '')
-            name = entry.get('name1', '')
-            club = entry.get('affiliation', '') or ''
-            card_no = entry.get('card_number', '')
-            start_time = entry.get('start_time', '')
 
-            # Escape semicolons in fields
-            name = name.replace(';', ',')
-            club = club.replace(';', ',')
+def compute_class_stats(startlist: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """
+    Tally per-class [entry count, rental count] pairs in one pass.
 
-            f.write(f'{class_name};{start_no};{name};{club};{card_no};{start_time}\n')
+    Shared by the class summary CSV and the summary report so each
+    output does not rescan the startlist for its own counts.
+    """
+    stats = defaultdict(lambda: [0, 0])
+    for entry in startlist:
+        class_stats = stats[entry.get('class_name', '')]
+        class_stats[0] += 1
+        if entry.get('is_rental', False):
+            class_stats[1] += 1
+    return stats
 
 
 def write_class_summary_csv(startlist: List[Dict[str, Any]], output_path: str) -> None:
@@ -411,32 +507,27 @@ def write_class_summary_csv(startlist: List[Dict[str, Any]], output_path: str) -
     - Class (クラス)
     - Count (人数)
     """
-    # Group by class
-    by_class = defaultdict(int)
-    for entry in startlist:
-        class_name = entry.get('class_name', '')
-        if class_name:
-            by_class[class_name] += 1
+    by_class = {class_name: stats[0]
+                for class_name, stats in compute_class_stats(startlist).items()
+                if class_name}
+
+    _write_class_summary(by_class, output_path)
 
-    fieldnames = ['クラス', '人数']
 
-    with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+def _write_class_summary(by_class: Dict[str, int], output_path: str) -> None:
+    """Write precomputed per-class counts as the class summary CSV."""
+    with open(output_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(['クラス', '人数'])
 
         # Sort classes for consistent output
-        for class_name in sorted(by_class.keys()):
-            count = by_class[class_name]
-            writer.writerow({
-                'クラス': class_name,
-                '人数': count
-            })
+        writer.writerows(
+            (class_name, by_class[class_name])
+            for class_name in sorted(by_class.keys())
+        )
 
         # Write total row
-        writer.writerow({
-            'クラス': '合計',
-            '人数': sum(by_class.values())
-        })
+        writer.writerow(['合計', sum(by_class.values())])
 
 
 def generate_summary_report(
@@ -446,36 +537,34 @@ def generate_summary_report(
     """
     Generate a summary report of the startlist.
     """
-    # Group by class
-    by_class = defaultdict(list)
-    for entry in startlist:
-        by_class[entry.get('class_name', '')].append(entry)
+    by_class = compute_class_stats(startlist)
 
-    # Count totals
     total_entries = len(startlist)
-    rental_count = sum(1 for e in startlist if e.get('is_rental', False))
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("Startlist Summary Report\n")
-        f.write("=" * 50 + "\n\n")
-
-        f.write(f"Total entries: {total_entries}\n")
-        f.write(f"Rental cards: {rental_count}\n")
-        f.write(f"Own cards: {total_entries - rental_count}\n\n")
-
-        f.write("Class breakdown:\n")
-        f.write("-" * 40 + "\n")
+    rental_count = sum(stats[1] for stats in by_class.values())
+
+    lines = [
+        "Startlist Summary Report",
+        "=" * 50,
+        "",
+        f"Total entries: {total_entries}",
+        f"Rental cards: {rental_count}",
+        f"Own cards: {total_entries - rental_count}",
+        "",
+        "Class breakdown:",
+        "-" * 40,
+    ]
 
-        for class_name in sorted(by_class.keys()):
-            entries = by_class[class_name]
-            rental = sum(1 for e in entries if e.get('is_rental', False))
+    for class_name in sorted(by_class.keys()):
+        count, rental = by_class[class_name]
+        line = f"{class_name:15} {count:4} entries"
+        if rental > 0:
+            line += f" ({rental} rental)"
+        lines.append(line)
 
-            f.write(f"{class_name:15} {len(entries):4} entries")
-            if rental > 0:
-                f.write(f" ({rental} rental)")
-            f.write("\n")
+    lines.append("-" * 40)
 
-        f.write("-" * 40 + "\n")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
 
 
 if __name__ == '__main__':
@@ -10,8 +10,12 @@ Used to:
 - Look up registration numbers for competitor verification
 """
 
+import hashlib
+import io
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
@@ -38,6 +42,21 @@ RANKING_BASE_URLS = {
 # JOA Registration lookup URL
 JOA_REGISTRY_URL = "https://japan-o-entry.com/joaregist/openlist"
 
+# On-disk cache for fetched pages; rankings change rarely, so repeated
+# runs (and repeated classes within one run) skip the network entirely
+_CACHE_DIR = Path('.ranking_cache')
+
+# Strips the course-suffix from a class name (e.g. "M21A" -> "M21")
+_BASE_CLASS_RE = re.compile(r'[AES].*$')
+
+
+# Whitespace stripped out of names before matching. The regex serves the
+# vectorized pandas path; single-name normalization deletes the same
+# characters with a translation table, one C-level pass with no regex
+# engine involved.
+_WS_RE = re.compile(r'[\s\u3000]+')
+_WS_STRIP = str.maketrans('', '', ' \t\n\r\v\f\u3000\u00a0')
+
 
 def normalize_name(name: str) -> str:
     """
@@ -46,10 +65,8 @@ def normalize_name(name: str) -> str:
     """
     if not name:
         return ""
-    # Remove all types of whitespace
-    name = re.sub(r'[\s\u3000]+', '', name)
-    # Convert to lowercase for comparison
-    return name.lower()
+    # Remove all types of whitespace and lowercase for comparison
+    return name.translate(_WS_STRIP).lower()
 
 
 def create_ssl_context():
@@ -60,6 +77,11 @@ def create_ssl_context():
     return ctx
 
 
+# One context shared by all fetches: building a context loads the system
+# CA bundle, which is wasteful to repeat per request
+_SSL_CTX = create_ssl_context()
+
+
 def fetch_url(url: str, retries: int = 3) -> Optional[str]:
     """
     Fetch URL content with retry logic.
@@ -72,8 +94,7 @@ def fetch_url(url: str, retries: int = 3) -> Optional[str]:
     for attempt in range(retries):
         try:
             req = Request(url, headers=headers)
-            ctx = create_ssl_context()
-            with urlopen(req, context=ctx, timeout=30) as response:
+            with urlopen(req, context=_SSL_CTX, timeout=30) as response:
                 return response.read().decode('utf-8')
         except (URLError, HTTPError) as e:
             print(f"  Attempt {attempt + 1}/{retries} failed for {url}: {e}")
@@ -82,16 +103,44 @@ def fetch_url(url: str, retries: int = 3) -> Optional[str]:
     return None
 
 
-def pick_ranking_table(url: str) -> Optional['pd.DataFrame']:
+def _cached_fetch(url: str, ttl: int = 86400) -> Optional[str]:
+    """
+    Fetch URL content through an on-disk cache.
+
+    Cached responses younger than ttl seconds are served from disk
+    without touching the network. Cache failures fall back to a
+    plain fetch.
+    """
+    cache_path = _CACHE_DIR / (hashlib.sha1(url.encode('utf-8')).hexdigest() + '.html')
+
+    try:
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < ttl:
+            return cache_path.read_text(encoding='utf-8')
+    except OSError:
+        pass
+
+    html = fetch_url(url)
+
+    if html is not None:
+        try:
+            _CACHE_DIR.mkdir(exist_ok=True)
+            cache_path.write_text(html, encoding='utf-8')
+        except OSError:
+            pass
+
+    return html
+
+
+def pick_ranking_table(html: str) -> Optional['pd.DataFrame']:
     """
-    Extract ranking table from JOA ranking page.
+    Extract ranking table from JOA ranking page HTML.
     Looks for tables with '順位' and '氏名' columns.
     """
     if not HAS_PANDAS:
         return None
 
     try:
-        dfs = pd.read_html(url)
+        dfs = pd.read_html(io.StringIO(html))
         for df in dfs:
             cols = set(map(str, df.columns))
             if {'順位', '氏名'}.issubset(cols):
@@ -128,31 +177,45 @@ def fetch_class_rankings(base_class: str, max_rank: int = 1000) -> Dict[str, int
 
     print(f"  Fetching rankings for {base_class} ({pages_needed} pages)...")
 
-    for page in range(pages_needed):
-        url = base_url if page == 0 else f"{base_url}/{page}"
-
-        try:
-            df = pick_ranking_table(url)
-            if df is not None:
-                for _, row in df.iterrows():
-                    try:
-                        rank = int(row['順位'])
-                        name = str(row['氏名'])
-                        if rank <= max_rank:
-                            normalized = normalize_name(name)
-                            if normalized:
-                                rankings[normalized] = rank
-                    except (ValueError, KeyError):
+    urls = [base_url if page == 0 else f"{base_url}/{page}"
+            for page in range(pages_needed)]
+
+    # Fetch pages concurrently in waves of 4: the work is network-bound
+    # waiting, so a small pool overlaps requests while keeping server load
+    # modest. A missing or short page (under 50 rows) marks the end of the
+    # ranking list, so later waves are never requested at all.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for wave_start in range(0, len(urls), 4):
+            wave = urls[wave_start:wave_start + 4]
+            exhausted = False
+            for page, html in enumerate(executor.map(_cached_fetch, wave),
+                                        start=wave_start):
+                try:
+                    df = pick_ranking_table(html) if html is not None else None
+                    if df is None or df.empty:
+                        exhausted = True
                         continue
-            time.sleep(0.5)  # Be nice to the server
-        except Exception as e:
-            print(f"  Warning: Failed to fetch page {page}: {e}")
+                    # Vectorized extraction: coerce ranks and normalize
+                    # names column-wise instead of iterating rows with
+                    # per-cell conversions and normalize_name calls
+                    ranks = pd.to_numeric(df['順位'], errors='coerce')
+                    norm = (df['氏名'].astype(str)
+                            .str.replace(_WS_RE, '', regex=True)
+                            .str.lower())
+                    mask = ranks.notna() & (ranks <= max_rank) & (norm != '')
+                    rankings.update(zip(norm[mask], ranks[mask].astype(int)))
+                    if len(df) < 50:  # Last, partially filled page
+                        exhausted = True
+                except Exception as e:
+                    print(f"  Warning: Failed to parse page {page}: {e}")
+            if exhausted:
+                break
 
     print(f"  Retrieved {len(rankings)} rankings for {base_class}")
     return rankings
 
 
-def fetch_rankings(entries: List[Dict[str, Any]], target_class: str) -> Dict[str, int]:
+def fetch_rankings(entries: List['Entry'], target_class: str) -> Dict[str, int]:
     """
     Fetch rankings for entries in a specific class.
 
@@ -164,7 +227,7 @@ def fetch_rankings(entries: List[Dict[str, Any]], target_class: str) -> Dict[str
         Dictionary mapping entry names to their ranks
     """
     # Extract base class (e.g., "M21A" -> "M21")
-    base_class = re.sub(r'[AES].*$', '', target_class)
+    base_class = _BASE_CLASS_RE.sub('', target_class)
 
     # Fetch rankings
     all_rankings = fetch_class_rankings(base_class)
@@ -175,19 +238,19 @@ def fetch_rankings(entries: List[Dict[str, Any]], target_class: str) -> Dict[str
     # Match entries to rankings
     entry_rankings = {}
     for entry in entries:
-        if not entry.get('class_name', '').startswith(target_class):
+        if not entry.class_name.startswith(target_class):
             continue
 
         # Try matching by name1 (kanji)
-        name1_norm = normalize_name(entry.get('name1', ''))
+        name1_norm = normalize_name(entry.name1)
         if name1_norm in all_rankings:
-            entry_rankings[entry.get('name1', '')] = all_rankings[name1_norm]
+            entry_rankings[entry.name1] = all_rankings[name1_norm]
             continue
 
         # Try matching by name2 (hiragana)
-        name2_norm = normalize_name(entry.get('name2', ''))
+        name2_norm = normalize_name(entry.name2)
         if name2_norm in all_rankings:
-            entry_rankings[entry.get('name1', '')] = all_rankings[name2_norm]
+            entry_rankings[entry.name1] = all_rankings[name2_norm]
 
     return entry_rankings
 
@@ -232,7 +295,7 @@ def fetch_joa_registry() -> Dict[str, Dict[str, str]]:
     return {}
 
 
-def get_joa_registration(entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+def get_joa_registration(entries: List['Entry']) -> Dict[str, Dict[str, Any]]:
     """
     Look up JOA registration data for entries.
 
@@ -249,18 +312,18 @@ def get_joa_registration(entries: List[Dict[str, Any]]) -> Dict[str, Dict[str, A
     joa_data = {}
 
     for entry in entries:
-        joa_num = entry.get('joa_number', '')
+        joa_num = entry.joa_number
         if joa_num:
-            joa_data[entry.get('name1', '')] = {
+            joa_data[entry.name1] = {
                 'joa_number': joa_num,
-                'name': entry.get('name1', ''),
-                'class': entry.get('class_name', '')
+                'name': entry.name1,
+                'class': entry.class_name
             }
 
     return joa_data
 
 
-def lookup_entry_rank(entry: Dict[str, Any], rankings: Dict[str, int]) -> Optional[int]:
+def lookup_entry_rank(entry: 'Entry', rankings: Dict[str, int]) -> Optional[int]:
     """
     Look up rank for a specific entry.
 
@@ -271,17 +334,15 @@ def lookup_entry_rank(entry: Dict[str, Any], rankings: Dict[str, int]) -> Option
     Returns:
         Rank if found, None otherwise
     """
-    name1 = entry.get('name1', '')
-    if name1 in rankings:
-        return rankings[name1]
-
-    # Try normalized matching
-    name1_norm = normalize_name(name1)
-    for name, rank in rankings.items():
-        if normalize_name(name) == name1_norm:
-            return rank
-
-    return None
+    name1 = entry.name1
+    rank = rankings.get(name1)
+    if rank is not None:
+        return rank
+
+    # Try normalized matching; ranking dicts are keyed by either the raw
+    # or the normalized name, so two dict probes cover both without
+    # scanning the whole table
+    return rankings.get(normalize_name(name1))
 
 
 if __name__ == '__main__':
@@ -8,24 +8,55 @@ Generates startlists with:
 - Configurable start times, intervals, and start numbers
 """
 
+import hashlib
+import heapq
 import random
 import re
+import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, Tuple, Union
+from collections import Counter, defaultdict, deque
 
+from entry_parser import Entry
 from ranking_fetcher import lookup_entry_rank
 
 
+# Strips the course-suffix from a class name (e.g. "M21A" -> "M21")
+_BASE_CLASS_RE = re.compile(r'[AES].*$')
+
+# HH:MM[:SS] with either ':' or ';' as separator — the only formats the
+# configs use, matched in one scan instead of probing strptime formats
+_TIME_RE = re.compile(r'^(\d{1,2})[:;](\d{2})(?:[:;](\d{2}))?$')
+
+# Trailing team numbers on affiliations (e.g. "ClubName2" -> "ClubName")
+_DIGIT_SUFFIX_RE = re.compile(r'\d+$')
+
+
+def _class_rng(base_seed: int, class_name: str) -> random.Random:
+    """
+    Derive an independent per-class RNG by seed mixing.
+
+    XORing the base seed with a SHA-256 hash of the class name gives
+    each class a decorrelated sub-stream that depends only on the class
+    identity, not on loop order — so classes can be generated in any
+    order, or in parallel, with identical results.
+    """
+    digest = hashlib.sha256(class_name.encode('utf-8')).digest()
+    return random.Random(base_seed ^ int.from_bytes(digest[:8], 'big'))
+
+
 def parse_time(time_str: str) -> datetime:
     """Parse time string to datetime object."""
-    # Try common formats
-    formats = ['%H:%M', '%H:%M:%S', '%H;%M', '%H;%M;%S']
-    for fmt in formats:
+    m = _TIME_RE.match(time_str)
+    if m:
         try:
-            return datetime.strptime(time_str, fmt)
+            return datetime(1900, 1, 1,
+                            int(m.group(1)), int(m.group(2)),
+                            int(m.group(3) or 0))
         except ValueError:
-            continue
+            pass
     raise ValueError(f"Cannot parse time: {time_str}")
 
 
@@ -67,11 +98,11 @@ def get_effective_config(
 
 
 def split_class_by_ranking(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     split_count: int,
     rankings: Dict[str, int],
-    seed: Optional[int] = None
-) -> List[List[Dict[str, Any]]]:
+    rng: Optional[random.Random] = None
+) -> List[List[Entry]]:
     """
     Split entries into groups based on ranking.
 
@@ -84,20 +115,28 @@ def split_class_by_ranking(
         entries: List of entries to split
         split_count: Number of groups to create
         rankings: Dictionary mapping names to ranks
-        seed: Random seed for reproducibility
+        rng: Random instance for reproducibility (global random if None)
 
     Returns:
         List of lists, each containing entries for one group
     """
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random
 
-    # Separate ranked and unranked entries
+    # Separate ranked and unranked entries. Ranks are memoized per
+    # (name1, name2), so a competitor appearing more than once (e.g. in
+    # several split passes over the same class) is only looked up and
+    # name-normalized once.
     ranked_entries = []
     unranked_entries = []
+    rank_of = {}
 
     for entry in entries:
-        rank = lookup_entry_rank(entry, rankings)
+        key = (entry.name1, entry.name2)
+        if key in rank_of:
+            rank = rank_of[key]
+        else:
+            rank = rank_of[key] = lookup_entry_rank(entry, rankings)
         if rank is not None:
             ranked_entries.append((rank, entry))
         else:
@@ -106,81 +145,175 @@ def split_class_by_ranking(
     # Sort ranked entries by rank
     ranked_entries.sort(key=lambda x: x[0])
 
-    # Create groups
-    groups = [[] for _ in range(split_count)]
-
-    # Distribute ranked entries by modulo
-    for i, (rank, entry) in enumerate(ranked_entries):
-        # Reconstruct internal rank (1, 2, 3, ...)
-        internal_rank = i + 1
-        group_idx = (internal_rank - 1) % split_count
-        groups[group_idx].append(entry)
+    # Distribute ranked entries round-robin: internal rank i goes to
+    # group i % split_count, which is exactly a stride slice over the
+    # sorted order — one C-level slice per group, no Python loop
+    ranked = [entry for rank, entry in ranked_entries]
+    groups = [ranked[k::split_count] for k in range(split_count)]
 
     # Shuffle unranked entries
-    random.shuffle(unranked_entries)
+    rng.shuffle(unranked_entries)
 
-    # Distribute unranked entries to balance group sizes
-    group_sizes = [len(g) for g in groups]
+    # Distribute unranked entries to balance group sizes; a min-heap
+    # finds the smallest group in O(log K) instead of scanning all sizes
+    # per entry (ties still resolve to the lowest group index)
+    size_heap = [(len(group), idx) for idx, group in enumerate(groups)]
+    heapq.heapify(size_heap)
     for entry in unranked_entries:
-        # Find smallest group
-        min_idx = group_sizes.index(min(group_sizes))
-        groups[min_idx].append(entry)
-        group_sizes[min_idx] += 1
+        size, idx = heapq.heappop(size_heap)
+        groups[idx].append(entry)
+        heapq.heappush(size_heap, (size + 1, idx))
 
     return groups
 
 
-def split_affiliations_for_check(entry: Dict[str, Any]) -> List[str]:
+@lru_cache(maxsize=None)
+def _clean_affiliations(aff_tuple: Tuple[str, ...]) -> frozenset:
+    """
+    Clean an affiliation tuple for consecutive-runner checks.
+
+    Drops numeric suffixes and lowercases. Cached per unique tuple:
+    club runners share the same affiliation strings across hundreds of
+    entries, so the regex runs once per distinct club, not per entry.
+    """
+    result = []
+    for aff in aff_tuple:
+        aff_clean = _DIGIT_SUFFIX_RE.sub('', aff).strip()
+        if aff_clean:
+            result.append(aff_clean.lower())
+
+    return frozenset(result)
+
+
+def split_affiliations_for_check(entry: Entry) -> frozenset:
     """
     Get affiliations for checking consecutive runners.
     Drops numeric suffixes from affiliations.
     """
-    affiliations = entry.get('affiliations', [])
+    affiliations = entry.affiliations
     if not affiliations:
-        aff = entry.get('affiliation', '')
+        aff = entry.affiliation
         if aff and aff != '-':
-            affiliations = [aff]
+            affiliations = (aff,)
 
-    # Remove numeric suffixes
-    result = []
-    for aff in affiliations:
-        aff_clean = re.sub(r'\d+$', '', aff).strip()
-        if aff_clean:
-            result.append(aff_clean.lower())
+    return _clean_affiliations(affiliations)
 
-    return result
+
+# An entry's affiliation key: None (no affiliation), an interned string
+# (single affiliation — the overwhelming common case), or a frozenset
+# (multiple affiliations)
+_AffKey = Optional[Union[str, frozenset]]
 
 
-def has_affiliation_overlap(entry1: Dict[str, Any], entry2: Dict[str, Any]) -> bool:
+def _affiliation_key(entry: Entry) -> _AffKey:
     """
-    Check if two entries have overlapping affiliations.
+    Cleaned affiliation key used for consecutive-runner checks.
+
+    Single affiliations are kept as interned strings so the common-case
+    overlap check is a pointer compare, with no set allocation at all.
     """
-    affs1 = set(split_affiliations_for_check(entry1))
-    affs2 = set(split_affiliations_for_check(entry2))
+    key = split_affiliations_for_check(entry)
+    if not key:
+        return None
+    if len(key) == 1:
+        return sys.intern(next(iter(key)))
+    return key
 
-    if not affs1 or not affs2:
+
+def has_affiliation_overlap(key1: _AffKey, key2: _AffKey) -> bool:
+    """
+    Check if two precomputed affiliation keys overlap.
+    """
+    if key1 is None or key2 is None:
         return False
+    if type(key1) is str:
+        if type(key2) is str:
+            return key1 is key2 or key1 == key2
+        return key1 in key2
+    if type(key2) is str:
+        return key2 in key1
+
+    return not key1.isdisjoint(key2)
+
+
+def _intern_affiliation_ids(keys: List[_AffKey]) -> Optional[List[int]]:
+    """
+    Map affiliation keys to integer ids for fast conflict counting.
+
+    Only valid when no entry has multiple affiliations (the common
+    case): then two entries conflict exactly when their ids are equal.
+    Entries without any affiliation get a unique negative id so they
+    never compare equal. Returns None when a multi-affiliation entry
+    makes the id comparison unsound.
+    """
+    table = {}
+    ids = []
+    for i, key in enumerate(keys):
+        if type(key) is frozenset:
+            return None
+        if key is None:
+            ids.append(-(i + 1))
+        else:
+            ids.append(table.setdefault(key, len(table)))
+    return ids
+
+
+def _interleave_by_affiliation(order: List[int], keys: List[_AffKey]) -> List[int]:
+    """
+    Arrange entry indices so same-affiliation entries are spread apart.
+
+    Task-scheduler pattern: groups are kept on a max-heap by remaining
+    size, and the largest group not just emitted goes next. For groups
+    of equal affiliation keys this yields a conflict-free ordering in
+    one O(N log K) pass whenever one exists (max group <= ceil(N/2)).
+    """
+    groups = defaultdict(deque)
+    for idx in order:
+        groups[keys[idx]].append(idx)
 
-    return bool(affs1 & affs2)
+    # (-remaining, tiebreak, members); tiebreak keeps heap comparisons
+    # away from the unorderable frozenset members
+    heap = [(-len(members), tiebreak, members)
+            for tiebreak, members in enumerate(groups.values())]
+    heapq.heapify(heap)
+
+    result = []
+    held_back = None  # Group just emitted, kept out for one round
+
+    while heap:
+        neg_count, tiebreak, members = heapq.heappop(heap)
+        result.append(members.popleft())
+
+        if held_back is not None:
+            heapq.heappush(heap, held_back)
+            held_back = None
+
+        if neg_count + 1 < 0:
+            held_back = (neg_count + 1, tiebreak, members)
+
+    if held_back is not None:
+        # Only one group left: its remainder runs back-to-back
+        result.extend(held_back[2])
+
+    return result
 
 
 def shuffle_avoiding_consecutive_affiliations(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     max_attempts: int = 1000,
-    seed: Optional[int] = None
-) -> List[Dict[str, Any]]:
+    rng: Optional[random.Random] = None
+) -> List[Entry]:
     """
     Shuffle entries to avoid consecutive same-affiliation runners.
 
-    Uses a greedy algorithm with backtracking:
-    1. Start with shuffled list
-    2. Try to find valid ordering
-    3. If stuck, reshuffle and retry
+    A heap-based interleaving pass spreads each affiliation group apart
+    in one O(N log K) sweep; randomized greedy refinement only runs when
+    that pass leaves conflicts (overlapping multi-affiliation sets).
 
     Args:
         entries: List of entries to shuffle
-        max_attempts: Maximum shuffle attempts
-        seed: Random seed for reproducibility
+        max_attempts: Maximum refinement attempts
+        rng: Random instance for reproducibility (global random if None)
 
     Returns:
         Shuffled list with minimal consecutive affiliations
@@ -188,75 +321,119 @@ def shuffle_avoiding_consecutive_affiliations(
     if len(entries) <= 1:
         return entries
 
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random
 
-    best_result = entries.copy()
-    best_conflicts = count_consecutive_conflicts(entries)
+    # Clean every entry's affiliations once up front; the shuffle, greedy
+    # and conflict passes below all work on index lists over this cache,
+    # so no regex or lowercasing runs inside the refinement loop
+    keys = [_affiliation_key(entry) for entry in entries]
 
-    for attempt in range(max_attempts):
-        # Shuffle entries
+    # Fast path: when no two entries share an affiliation, every
+    # permutation is conflict-free — one shuffle and done
+    non_empty = [key for key in keys if key is not None]
+    if (len(set(non_empty)) == len(non_empty)
+            and all(type(key) is str for key in non_empty)):
         shuffled = entries.copy()
-        random.shuffle(shuffled)
+        rng.shuffle(shuffled)
+        return shuffled
 
-        # Try greedy ordering
-        result = greedy_order_by_affiliation(shuffled)
-        conflicts = count_consecutive_conflicts(result)
+    ids = _intern_affiliation_ids(keys)
+    order = list(range(len(entries)))
 
-        if conflicts < best_conflicts:
-            best_result = result
-            best_conflicts = conflicts
+    # Feasibility bound (task-scheduler math): a group of size M forces
+    # at least 2M - N - 1 adjacent pairs, so once the best ordering
+    # reaches that floor no amount of retrying can improve it
+    counts = Counter(key for key in keys if key)
+    max_group = max(counts.values(), default=0)
+    lower_bound = max(0, 2 * max_group - len(entries) - 1)
+
+    # Randomize within-group order, then interleave groups directly
+    # instead of hoping a blind reshuffle lands on a valid ordering
+    rng.shuffle(order)
+    best_order = _interleave_by_affiliation(order, keys)
+    best_conflicts = count_consecutive_conflicts(best_order, keys, ids)
 
-        if conflicts == 0:
+    for attempt in range(max_attempts):
+        if best_conflicts <= lower_bound:
             break
 
-    if best_conflicts > 0:
+        # Refinement: reshuffle the one index array in place and
+        # greedily reorder — no per-attempt list clone
+        rng.shuffle(order)
+        result = greedy_order_by_affiliation(order, keys)
+        conflicts = count_consecutive_conflicts(result, keys, ids)
+
+        if conflicts < best_conflicts:
+            best_order = result
+            best_conflicts = conflicts
+
+    if best_conflicts > lower_bound:
         print(f"  Warning: Could not eliminate all consecutive affiliations "
               f"({best_conflicts} conflicts remain)")
+    elif best_conflicts > 0:
+        print(f"  Note: {best_conflicts} consecutive-affiliation conflicts are "
+              f"unavoidable for this class")
 
-    return best_result
+    return [entries[i] for i in best_order]
 
 
-def greedy_order_by_affiliation(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def greedy_order_by_affiliation(order: List[int], keys: List[_AffKey]) -> List[int]:
     """
-    Greedy algorithm to order entries avoiding consecutive affiliations.
+    Greedy algorithm to order entry indices avoiding consecutive affiliations.
     """
-    if len(entries) <= 1:
-        return entries
-
-    remaining = entries.copy()
-    result = [remaining.pop(0)]
-
-    while remaining:
-        # Find an entry that doesn't conflict with the last one
-        found = False
-        for i, entry in enumerate(remaining):
-            if not has_affiliation_overlap(result[-1], entry):
-                result.append(remaining.pop(i))
-                found = True
+    n = len(order)
+    if n <= 1:
+        return order
+
+    # Interior list.pop(i) shifts every later element; a taken mask over
+    # fixed positions removes those memmoves. `first` skips the already
+    # consumed prefix so scans don't restart from position zero.
+    taken = bytearray(n)
+    taken[0] = 1
+    result = [order[0]]
+    first = 1
+
+    for _ in range(n - 1):
+        while taken[first]:
+            first += 1
+
+        last_key = keys[result[-1]]
+        pick = first
+        for j in range(first, n):
+            if not taken[j] and not has_affiliation_overlap(last_key, keys[order[j]]):
+                pick = j
                 break
 
-        if not found:
-            # No non-conflicting entry, just add the first one
-            result.append(remaining.pop(0))
+        taken[pick] = 1
+        result.append(order[pick])
 
     return result
 
 
-def count_consecutive_conflicts(entries: List[Dict[str, Any]]) -> int:
-    """Count number of consecutive same-affiliation pairs."""
+def count_consecutive_conflicts(
+    order: List[int],
+    keys: List[_AffKey],
+    ids: Optional[List[int]] = None
+) -> int:
+    """Count number of consecutive same-affiliation pairs in an index order."""
+    if ids is not None:
+        # Single-affiliation fast path: conflict == equal integer ids
+        seq = [ids[i] for i in order]
+        return sum(a == b for a, b in zip(seq, seq[1:]))
+
     conflicts = 0
-    for i in range(len(entries) - 1):
-        if has_affiliation_overlap(entries[i], entries[i + 1]):
+    for i in range(len(order) - 1):
+        if has_affiliation_overlap(keys[order[i]], keys[order[i + 1]]):
             conflicts += 1
     return conflicts
 
 
 def generate_startlist_for_class(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     class_name: str,
     config: Dict[str, Any],
-    seed: Optional[int] = None
+    rng: Optional[random.Random] = None
 ) -> List[Dict[str, Any]]:
     """
     Generate startlist entries for a single class.
@@ -265,7 +442,7 @@ def generate_startlist_for_class(
         entries: List of entries for this class
         class_name: Name of the class
         config: Configuration for this class
-        seed: Random seed for reproducibility
+        rng: Random instance for reproducibility (global random if None)
 
     Returns:
         List of startlist entries with assigned start times and numbers
@@ -273,54 +450,71 @@ def generate_startlist_for_class(
     if not entries:
         return []
 
+    if rng is None:
+        rng = random
+
     # Shuffle avoiding consecutive affiliations if enabled
     if config.get('affiliation_split', True):
-        ordered = shuffle_avoiding_consecutive_affiliations(entries, seed=seed)
+        ordered = shuffle_avoiding_consecutive_affiliations(entries, rng=rng)
     else:
         ordered = entries.copy()
-        if seed is not None:
-            random.seed(seed)
-        random.shuffle(ordered)
-
-    # Assign start times and numbers
-    start_time = parse_time(config['start_time'])
+        rng.shuffle(ordered)
+
+    # Assign start times and numbers. Times advance in whole minutes, so
+    # plain integer arithmetic replaces a timedelta allocation plus
+    # strftime call per entry; the whole list is built in one
+    # comprehension
+    start_time = config['start_time']
+    if not isinstance(start_time, datetime):
+        start_time = parse_time(start_time)
     start_number = int(config['start_number'])
     interval = int(config.get('interval', 1))
 
-    startlist = []
-    for i, entry in enumerate(ordered):
-        entry_time = start_time + timedelta(minutes=i * interval)
-        entry_number = start_number + i
+    base_minutes = start_time.hour * 60 + start_time.minute
+    seconds = start_time.second
+
+    # Batch-generate all start time strings from one arithmetic range
+    # before assembling the rows
+    time_strs = [
+        f"{m // 60 % 24:02d}:{m % 60:02d}:{seconds:02d}"
+        for m in (base_minutes + i * interval for i in range(len(ordered)))
+    ]
 
-        startlist_entry = {
+    return [
+        {
             'class_name': class_name,
-            'start_number': entry_number,
-            'name1': entry.get('name1', ''),
-            'name2': entry.get('name2', ''),
-            'affiliation': entry.get('affiliation', ''),
-            'start_time': format_time(entry_time),
-            'card_number': entry.get('card_number', ''),
-            'is_rental': entry.get('is_rental', False),
-            'joa_number': entry.get('joa_number', ''),
-            'gender': entry.get('gender', '')
+            'start_number': start_number + i,
+            'name1': entry.name1,
+            'name2': entry.name2,
+            'affiliation': entry.affiliation,
+            'start_time': time_strs[i],
+            'card_number': entry.card_number,
+            'is_rental': entry.is_rental,
+            'joa_number': entry.joa_number,
+            'gender': entry.gender
         }
-        startlist.append(startlist_entry)
-
-    return startlist
+        for i, entry in enumerate(ordered)
+    ]
 
 
 def generate_startlist(
-    entries: List[Dict[str, Any]],
+    entries: List[Entry],
     lane_config: Dict[str, Any],
     class_overrides: Dict[str, Dict[str, Any]],
     splits_config: Dict[str, Dict[str, Any]],
     rankings: Dict[str, Dict[str, int]],
     joa_data: Dict[str, Dict[str, Any]],
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    parallel: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Generate complete startlist for a lane.
 
+    Planning and generation run in two phases: a sequential pass first
+    resolves each class's start time/number offsets (which accumulate in
+    lane order), then the per-class generation — independent given the
+    derived sub-seeds — runs either serially or on a process pool.
+
     Args:
         entries: All entries
         lane_config: Configuration for this lane
@@ -329,6 +523,9 @@ def generate_startlist(
         rankings: Rankings data by class
         joa_data: JOA registration data
         seed: Random seed for reproducibility
+        parallel: Generate classes on a process pool (off by default;
+            callers that already parallelize across lanes should leave
+            this disabled)
 
     Returns:
         Complete startlist for the lane
@@ -336,13 +533,31 @@ def generate_startlist(
     startlist = []
     classes = lane_config.get('classes', [])
 
+    # Index entries by class once; the per-class loop then does O(1)
+    # lookups instead of rescanning the full entry list per class
+    by_class = defaultdict(list)
+    for entry in entries:
+        by_class[entry.class_name].append(entry)
+
+    # One local RNG per lane for ranking splits; per-class sub-streams
+    # are derived from base_seed by class name (see _class_rng), so no
+    # call path reseeds the global Mersenne Twister and classes never
+    # share correlated shuffle sequences
+    rng = random.Random(seed)
+    base_seed = seed if seed is not None else rng.randrange(2**63)
+
     # Track current start time and number for auto-incrementing
     current_time = parse_time(lane_config['start_time'])
     current_number = int(lane_config['start_number'])
 
+    # Phase 1: plan. Entry counts are known before generation, so each
+    # class's start time/number offsets can be resolved up front and the
+    # generation calls become independent of one another.
+    tasks = []
+
     for class_name in classes:
         # Check if this class needs splitting
-        base_class = re.sub(r'[AES].*$', '', class_name)
+        base_class = _BASE_CLASS_RE.sub('', class_name)
 
         if base_class in splits_config:
             split_cfg = splits_config[base_class]
@@ -351,7 +566,7 @@ def generate_startlist(
             use_ranking = split_cfg.get('use_ranking', True)
 
             # Get entries for this class
-            class_entries = [e for e in entries if e.get('class_name', '') == class_name]
+            class_entries = by_class.get(class_name, [])
 
             if not class_entries:
                 continue
@@ -359,52 +574,59 @@ def generate_startlist(
             # Split by ranking
             class_rankings = rankings.get(base_class, {})
             groups = split_class_by_ranking(
-                class_entries, split_count, class_rankings, seed
+                class_entries, split_count, class_rankings, rng
             )
 
-            # Generate startlist for each split
+            # Plan each split
             for group_num, group_entries in enumerate(groups, start=1):
                 split_class_name = f"{class_name}{suffix_format.format(group_num)}"
 
                 # Get config for this split class
                 config = get_effective_config(split_class_name, lane_config, class_overrides)
-                config['start_time'] = format_time(current_time).rsplit(':', 1)[0]  # HH:MM format
+                config['start_time'] = current_time
                 config['start_number'] = current_number
 
-                split_startlist = generate_startlist_for_class(
-                    group_entries, split_class_name, config, seed
-                )
-
-                startlist.extend(split_startlist)
+                tasks.append((group_entries, split_class_name, config,
+                              _class_rng(base_seed, split_class_name)))
 
                 # Update tracking
-                if split_startlist:
+                if group_entries:
                     interval = int(config.get('interval', 1))
-                    current_time += timedelta(minutes=len(split_startlist) * interval)
-                    current_number += len(split_startlist)
+                    current_time += timedelta(minutes=len(group_entries) * interval)
+                    current_number += len(group_entries)
 
         else:
-            # No splitting, generate directly
-            class_entries = [e for e in entries if e.get('class_name', '') == class_name]
+            # No splitting, plan directly
+            class_entries = by_class.get(class_name, [])
 
             if not class_entries:
                 continue
 
             config = get_effective_config(class_name, lane_config, class_overrides)
-            config['start_time'] = format_time(current_time).rsplit(':', 1)[0]
+            config['start_time'] = current_time
             config['start_number'] = current_number
 
-            class_startlist = generate_startlist_for_class(
-                class_entries, class_name, config, seed
-            )
-
-            startlist.extend(class_startlist)
+            tasks.append((class_entries, class_name, config,
+                          _class_rng(base_seed, class_name)))
 
             # Update tracking
-            if class_startlist:
-                interval = int(config.get('interval', 1))
-                current_time += timedelta(minutes=len(class_startlist) * interval)
-                current_number += len(class_startlist)
+            interval = int(config.get('interval', 1))
+            current_time += timedelta(minutes=len(class_entries) * interval)
+            current_number += len(class_entries)
+
+    # Phase 2: generate. Each task carries its own offsets and RNG
+    # sub-stream, so results are identical whether classes run serially
+    # or across a process pool; stitching in task order preserves the
+    # lane's time ordering either way.
+    if parallel and len(tasks) > 1:
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(generate_startlist_for_class, *task)
+                       for task in tasks]
+            for future in futures:
+                startlist.extend(future.result())
+    else:
+        for task in tasks:
+            startlist.extend(generate_startlist_for_class(*task))
 
     return startlist
 
@@ -412,11 +634,11 @@ def generate_startlist(
 if __name__ == '__main__':
     # Test with sample data
     test_entries = [
-        {'class_name': 'M21A', 'name1': 'Runner A', 'affiliation': 'Club1'},
-        {'class_name': 'M21A', 'name1': 'Runner B', 'affiliation': 'Club1'},
-        {'class_name': 'M21A', 'name1': 'Runner C', 'affiliation': 'Club2'},
-        {'class_name': 'M21A', 'name1': 'Runner D', 'affiliation': 'Club2'},
-        {'class_name': 'M21A', 'name1': 'Runner E', 'affiliation': 'Club3'},
+        Entry(class_name='M21A', name1='Runner A', affiliation='Club1'),
+        Entry(class_name='M21A', name1='Runner B', affiliation='Club1'),
+        Entry(class_name='M21A', name1='Runner C', affiliation='Club2'),
+        Entry(class_name='M21A', name1='Runner D', affiliation='Club2'),
+        Entry(class_name='M21A', name1='Runner E', affiliation='Club3'),
     ]
 
     config = {
@@ -426,7 +648,8 @@ if __name__ == '__main__':
         'affiliation_split': True
     }
 
-    result = generate_startlist_for_class(test_entries, 'M21A', config, seed=42)
+    result = generate_startlist_for_class(test_entries, 'M21A', config,
+                                          rng=random.Random(42))
     print("Generated startlist:")
     for entry in result:
         print(f"  {entry['start_number']} {entry['start_time']} {entry['name1']} ({entry['affiliation']})")